@@ -3,35 +3,75 @@
 Application constants
 """
 
+import json
+import sys
+from enum import Enum
+from types import MappingProxyType
+from typing import NamedTuple, Tuple
+
+
+def _interned(mapping):
+    """Return a read-only copy of a str->str mapping with keys and values interned"""
+    return MappingProxyType({sys.intern(k): sys.intern(v) for k, v in mapping.items()})
+
+
 # Version
 VERSION = '1.0.0'
 API_VERSION = 'v1'
 
+# Mappings below (UBX_CLASSES, the *_MAP views, NMEA_SENTENCES, ERROR_CODES,
+# STATUS_MESSAGES, COLORS_MAP and API_RESPONSE with its nested templates) are
+# read-only MappingProxyType views. They are not JSON serializable: pass
+# dict(...) to json.dumps()/jsonify(), and copy with dict(...) or {**...}
+# before modifying.
+
 # GNSS Constants
-GNSS_FIX_QUALITY = {
-    0: 'No Fix',
-    1: 'GPS Fix',
-    2: 'DGPS Fix',
-    3: 'PPS Fix',
-    4: 'RTK Fixed',
-    5: 'RTK Float',
-    6: 'DR',
-    7: 'Manual',
-    8: 'Simulation'
-}
-
-GNSS_SIGNAL_QUALITY = {
-    0: 'No Signal',
-    1: 'Searching',
-    2: 'Acquired',
-    3: 'Unusable',
-    4: 'Code Lock',
-    5: 'Code & Carrier Lock',
-    6: 'Code & Carrier Lock (Time)'
-}
+# Fix and signal quality labels, indexed directly by their integer code.
+# Tuples accept negative indices, so decode untrusted codes with
+# fix_quality_name()/signal_quality_name() rather than indexing directly.
+GNSS_FIX_QUALITY = tuple(map(sys.intern, (
+    'No Fix',       # 0
+    'GPS Fix',      # 1
+    'DGPS Fix',     # 2
+    'PPS Fix',      # 3
+    'RTK Fixed',    # 4
+    'RTK Float',    # 5
+    'DR',           # 6
+    'Manual',       # 7
+    'Simulation'    # 8
+)))
+
+GNSS_SIGNAL_QUALITY = tuple(map(sys.intern, (
+    'No Signal',                    # 0
+    'Searching',                    # 1
+    'Acquired',                     # 2
+    'Unusable',                     # 3
+    'Code Lock',                    # 4
+    'Code & Carrier Lock',          # 5
+    'Code & Carrier Lock (Time)'    # 6
+)))
+
+# Backward-compatible mapping views keyed by code
+GNSS_FIX_QUALITY_MAP = MappingProxyType(dict(enumerate(GNSS_FIX_QUALITY)))
+GNSS_SIGNAL_QUALITY_MAP = MappingProxyType(dict(enumerate(GNSS_SIGNAL_QUALITY)))
+
+
+def fix_quality_name(code):
+    """Return the fix quality label for a code, or None if out of range"""
+    if 0 <= code < len(GNSS_FIX_QUALITY):
+        return GNSS_FIX_QUALITY[code]
+    return None
+
+
+def signal_quality_name(code):
+    """Return the signal quality label for a code, or None if out of range"""
+    if 0 <= code < len(GNSS_SIGNAL_QUALITY):
+        return GNSS_SIGNAL_QUALITY[code]
+    return None
+
 
 # UBX Message Classes
-UBX_CLASSES = {
+UBX_CLASSES = MappingProxyType({
     0x01: 'NAV',   # Navigation
     0x02: 'RXM',   # Receiver Manager
     0x04: 'INF',   # Information
@@ -44,10 +84,26 @@ UBX_CLASSES = {
     0x21: 'LOG',   # Logging
     0x27: 'SEC',   # Security
     0x28: 'HNR'    # High Rate Navigation
-}
+})
+
+# Dense lookup table indexed by class ID (None for unassigned IDs), used on
+# the per-frame parse path instead of hashing into UBX_CLASSES
+UBX_CLASS_TABLE = [None] * (max(UBX_CLASSES) + 1)
+for _cls_id, _cls_name in UBX_CLASSES.items():
+    UBX_CLASS_TABLE[_cls_id] = _cls_name
+UBX_CLASS_TABLE = tuple(UBX_CLASS_TABLE)
+del _cls_id, _cls_name
+
+
+def ubx_class_name(cls_id):
+    """Return the UBX class name for a class ID, or None if unknown"""
+    if 0 <= cls_id < len(UBX_CLASS_TABLE):
+        return UBX_CLASS_TABLE[cls_id]
+    return None
+
 
 # NMEA Sentence Types
-NMEA_SENTENCES = {
+NMEA_SENTENCES = _interned({
     'GGA': 'Global Positioning System Fix Data',
     'GLL': 'Geographic Position - Latitude/Longitude',
     'GSA': 'GNSS DOP and Active Satellites',
@@ -56,22 +112,31 @@ NMEA_SENTENCES = {
     'VTG': 'Course Over Ground and Ground Speed',
     'ZDA': 'Time & Date',
     'PUBX': 'u-blox Proprietary'
-}
+})
 
 # Error Codes
-ERROR_CODES = {
-    'GNSS001': 'GNSS receiver not connected',
-    'GNSS002': 'Invalid NMEA sentence',
-    'GNSS003': 'Serial port error',
-    'WEB001': 'Invalid API request',
-    'WEB002': 'Resource not found',
-    'WEB003': 'Rate limit exceeded',
-    'SYS001': 'System configuration error',
-    'SYS002': 'Database connection failed'
-}
+class ErrorCode(str, Enum):
+    """Application error codes; members are singletons, compare with ``is``"""
+    GNSS001 = 'GNSS receiver not connected'
+    GNSS002 = 'Invalid NMEA sentence'
+    GNSS003 = 'Serial port error'
+    WEB001 = 'Invalid API request'
+    WEB002 = 'Resource not found'
+    WEB003 = 'Rate limit exceeded'
+    SYS001 = 'System configuration error'
+    SYS002 = 'Database connection failed'
+
+    # Behave like StrEnum (3.11+): str()/format() give the message, not the
+    # member name, consistently across Python versions
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+
+# Plain code -> message mapping, kept for API compatibility
+ERROR_CODES = _interned({m.name: m.value for m in ErrorCode})
 
 # Status Messages
-STATUS_MESSAGES = {
+STATUS_MESSAGES = _interned({
     'CONNECTING': 'Connecting to GNSS receiver...',
     'CONNECTED': 'GNSS receiver connected',
     'DISCONNECTED': 'GNSS receiver disconnected',
@@ -80,30 +145,67 @@ STATUS_MESSAGES = {
     '3D_FIX': '3D fix acquired',
     'RTK_FLOAT': 'RTK float solution',
     'RTK_FIXED': 'RTK fixed solution'
-}
+})
 
 # Colors for UI
-COLORS = {
-    'primary': '#0066cc',
-    'secondary': '#00cc66',
-    'accent': '#ff9900',
-    'danger': '#ff4444',
-    'warning': '#ffaa00',
-    'info': '#00aaff',
-    'success': '#00cc88',
-    'dark': '#1a1a2e',
-    'light': '#f8f9fa'
-}
+def _hex_to_rgb(color):
+    """Convert a ``#rrggbb`` string to an (r, g, b) tuple of ints"""
+    return (int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16))
+
+
+class Palette(NamedTuple):
+    """UI colour palette; each colour as a hex string and pre-parsed RGB tuple"""
+    primary: str
+    primary_rgb: Tuple[int, int, int]
+    secondary: str
+    secondary_rgb: Tuple[int, int, int]
+    accent: str
+    accent_rgb: Tuple[int, int, int]
+    danger: str
+    danger_rgb: Tuple[int, int, int]
+    warning: str
+    warning_rgb: Tuple[int, int, int]
+    info: str
+    info_rgb: Tuple[int, int, int]
+    success: str
+    success_rgb: Tuple[int, int, int]
+    dark: str
+    dark_rgb: Tuple[int, int, int]
+    light: str
+    light_rgb: Tuple[int, int, int]
+
+
+COLORS = Palette(
+    primary='#0066cc', primary_rgb=_hex_to_rgb('#0066cc'),
+    secondary='#00cc66', secondary_rgb=_hex_to_rgb('#00cc66'),
+    accent='#ff9900', accent_rgb=_hex_to_rgb('#ff9900'),
+    danger='#ff4444', danger_rgb=_hex_to_rgb('#ff4444'),
+    warning='#ffaa00', warning_rgb=_hex_to_rgb('#ffaa00'),
+    info='#00aaff', info_rgb=_hex_to_rgb('#00aaff'),
+    success='#00cc88', success_rgb=_hex_to_rgb('#00cc88'),
+    dark='#1a1a2e', dark_rgb=_hex_to_rgb('#1a1a2e'),
+    light='#f8f9fa', light_rgb=_hex_to_rgb('#f8f9fa')
+)
+
+# Name -> hex mapping, kept for callers that look colours up by key
+COLORS_MAP = MappingProxyType({
+    name: getattr(COLORS, name) for name in COLORS._fields if not name.endswith('_rgb')
+})
 
 # API Response Templates
-API_RESPONSE = {
-    'success': {
+# Build payloads from a copy, e.g. ``{**API_RESPONSE['success'], 'data': ...}``
+API_RESPONSE = MappingProxyType({
+    'success': MappingProxyType({
         'status': 'success',
         'code': 200
-    },
-    'error': {
+    }),
+    'error': MappingProxyType({
         'status': 'error',
         'code': 400
-    }
-}
+    })
+})
 
+# Pre-serialized JSON bodies for responses that carry no extra payload, e.g.
+# ``Response(API_RESPONSE_SUCCESS_BYTES, mimetype='application/json')``
+API_RESPONSE_SUCCESS_BYTES = json.dumps(dict(API_RESPONSE['success'])).encode()
+API_RESPONSE_ERROR_BYTES = json.dumps(dict(API_RESPONSE['error'])).encode()
@@ -8,128 +8,225 @@ Production-ready with environment variable support
 """
 
 import os
+import re
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from dataclasses import dataclass, field
+from typing import ClassVar, List, Mapping, Tuple
 import logging
+import logging.handlers
+import threading
 
-@dataclass
+# Bound once so field defaults avoid repeated attribute lookups on ``os``
+_ENV = os.environ
+
+# Parsed environment values, keyed by variable name
+_ENV_CACHE = {}
+
+def _env(name, default, cast=str):
+    """Read an environment variable, cast it and cache the result"""
+    if name in _ENV_CACHE:
+        return _ENV_CACHE[name]
+    raw = _ENV.get(name)
+    value = cast(raw) if raw is not None else default
+    _ENV_CACHE[name] = value
+    return value
+
+def _env_bool(name, default):
+    """Read a 'true'/'false' environment variable (case-insensitive)"""
+    return _env(name, default, lambda s: s.lower() == 'true')
+
+def _csv(s):
+    """Split a comma-separated string into a tuple, skipping split() for one item"""
+    return tuple(s.split(',')) if ',' in s else (s,)
+
+def _env_csv(name, default):
+    """Read a comma-separated environment variable as a tuple"""
+    return _env(name, default, _csv)
+
+# Comma-separated env values parsed once at import and shared by all instances
+_WILDCARD = ('*',)
+_CORS_ORIGINS = _env_csv('WEB_CORS_ORIGINS', _WILDCARD)
+_EXPORT_FORMATS = _env_csv('DATA_EXPORT_FORMATS', ('csv', 'json', 'kml'))
+
+@dataclass(frozen=True, slots=True)
 class GNSSConfig:
     """GNSS Receiver Configuration"""
-    port: str = os.getenv('GNSS_PORT', '/dev/ttyACM0')
-    baudrate: int = int(os.getenv('GNSS_BAUDRATE', '9600'))
-    timeout: float = float(os.getenv('GNSS_TIMEOUT', '1.0'))
-    protocol: str = os.getenv('GNSS_PROTOCOL', 'UBX')  # UBX or NMEA
-    enable_rtcm: bool = os.getenv('GNSS_ENABLE_RTCM', 'True').lower() == 'true'
-    enable_nmea: bool = os.getenv('GNSS_ENABLE_NMEA', 'True').lower() == 'true'
+    port: str = _env('GNSS_PORT', '/dev/ttyACM0')
+    baudrate: int = _env('GNSS_BAUDRATE', 9600, int)
+    timeout: float = _env('GNSS_TIMEOUT', 1.0, float)
+    protocol: str = _env('GNSS_PROTOCOL', 'UBX')  # UBX or NMEA
+    enable_rtcm: bool = _env_bool('GNSS_ENABLE_RTCM', True)
+    enable_nmea: bool = _env_bool('GNSS_ENABLE_NMEA', True)
     
     # UBX-specific settings
-    ubx_rate: int = int(os.getenv('GNSS_UBX_RATE', '1'))  # Measurement rate in Hz
-    nav_rate: int = int(os.getenv('GNSS_NAV_RATE', '1'))  # Navigation rate
+    ubx_rate: int = _env('GNSS_UBX_RATE', 1, int)  # Measurement rate in Hz
+    nav_rate: int = _env('GNSS_NAV_RATE', 1, int)  # Navigation rate
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WebConfig:
     """Web Server Configuration"""
-    host: str = os.getenv('WEB_HOST', '0.0.0.0')
-    port: int = int(os.getenv('WEB_PORT', '5000'))
-    debug: bool = os.getenv('WEB_DEBUG', 'False').lower() == 'true'
-    secret_key: str = os.getenv('WEB_SECRET_KEY', 'dev-secret-key-change-in-production')
-    cors_origins: List[str] = os.getenv('WEB_CORS_ORIGINS', '*').split(',')
+    host: str = _env('WEB_HOST', '0.0.0.0')
+    port: int = _env('WEB_PORT', 5000, int)
+    debug: bool = _env_bool('WEB_DEBUG', False)
+    secret_key: str = _env('WEB_SECRET_KEY', 'dev-secret-key-change-in-production')
+    cors_origins: Tuple[str, ...] = field(default_factory=lambda: _CORS_ORIGINS)
     
     # Security
-    session_timeout: int = int(os.getenv('WEB_SESSION_TIMEOUT', '3600'))  # seconds
-    rate_limit: str = os.getenv('WEB_RATE_LIMIT', '100 per minute')
+    session_timeout: int = _env('WEB_SESSION_TIMEOUT', 3600, int)  # seconds
+    rate_limit: str = _env('WEB_RATE_LIMIT', '100 per minute')
+
+_TILE_PLACEHOLDER = re.compile(r'\{([szxy])\}')
+_TILE_ARGS = ('s', 'z', 'x', 'y')
+
+@lru_cache(maxsize=None)
+def _compile_tile_template(template):
+    """Compile a ``{s}/{z}/{x}/{y}`` tile URL template to positional %-format
 
-@dataclass
+    Returns the format string and a callable that picks the template's
+    placeholders, in template order, out of an ``(s, z, x, y)`` tuple.
+    """
+    parts = _TILE_PLACEHOLDER.split(template)
+    fmt = '%s'.join(literal.replace('%', '%%') for literal in parts[::2])
+    indices = [_TILE_ARGS.index(name) for name in parts[1::2]]
+    if len(indices) > 1:
+        pick = itemgetter(*indices)
+    else:
+        def pick(args):
+            return tuple(args[i] for i in indices)
+    return fmt, pick
+
+@dataclass(frozen=True, slots=True)
 class MapConfig:
     """Map Configuration"""
-    default_center: List[float] = [0.0, 0.0]
+    default_center: List[float] = field(default_factory=lambda: [0.0, 0.0])
     default_zoom: int = 2
     max_zoom: int = 18
-    tile_provider: str = os.getenv('MAP_TILE_PROVIDER', 
+    tile_provider: str = _env('MAP_TILE_PROVIDER', 
         'https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png')
-    tile_attribution: str = os.getenv('MAP_TILE_ATTRIBUTION',
+    tile_attribution: str = _env('MAP_TILE_ATTRIBUTION',
         '© <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors')
     
     # Optional satellite imagery
-    satellite_layer: bool = os.getenv('MAP_SATELLITE_LAYER', 'True').lower() == 'true'
-    satellite_url: str = os.getenv('MAP_SATELLITE_URL',
+    satellite_layer: bool = _env_bool('MAP_SATELLITE_LAYER', True)
+    satellite_url: str = _env('MAP_SATELLITE_URL',
         'https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}')
 
-@dataclass
+    # URL builders; templates are compiled once and cached by
+    # _compile_tile_template(), so they are not part of the dataclass fields
+    def tile_url(self, s, z, x, y):
+        """Build a tile URL for the base map layer"""
+        fmt, pick = _compile_tile_template(self.tile_provider)
+        return fmt % pick((s, z, x, y))
+
+    def satellite_tile_url(self, s, z, x, y):
+        """Build a tile URL for the satellite imagery layer"""
+        fmt, pick = _compile_tile_template(self.satellite_url)
+        return fmt % pick((s, z, x, y))
+
+def _level_from_name(name):
+    """Return the numeric logging level for a level name, or None if unknown"""
+    if hasattr(logging, 'getLevelNamesMapping'):  # Python 3.11+
+        return logging.getLevelNamesMapping().get(name)
+    level = logging.getLevelName(name)
+    return level if isinstance(level, int) else None
+
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Logging Configuration"""
-    level: str = os.getenv('LOG_LEVEL', 'INFO').upper()
+    level: str = _env('LOG_LEVEL', 'INFO', str.upper)
     format: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     date_format: str = '%Y-%m-%d %H:%M:%S'
     
     # File logging
-    file_enabled: bool = os.getenv('LOG_FILE_ENABLED', 'True').lower() == 'true'
-    file_path: str = os.getenv('LOG_FILE_PATH', 'data/logs/gnss_viewer.log')
-    max_file_size: int = int(os.getenv('LOG_MAX_FILE_SIZE', '10485760'))  # 10MB
-    backup_count: int = int(os.getenv('LOG_BACKUP_COUNT', '5'))
+    file_enabled: bool = _env_bool('LOG_FILE_ENABLED', True)
+    file_path: str = _env('LOG_FILE_PATH', 'data/logs/gnss_viewer.log')
+    max_file_size: int = _env('LOG_MAX_FILE_SIZE', 10485760, int)  # 10MB
+    backup_count: int = _env('LOG_BACKUP_COUNT', 5, int)
 
-@dataclass
+    # Numeric level resolved from ``level``; unknown names fall back to INFO
+    level_int: int = field(init=False)
+
+    def __post_init__(self):
+        level_int = _level_from_name(self.level)
+        if level_int is None:
+            logging.getLogger(__name__).warning(
+                "Unknown log level %r, falling back to INFO", self.level)
+            level_int = logging.INFO
+        object.__setattr__(self, 'level_int', level_int)
+
+@dataclass(frozen=True, slots=True)
 class DataConfig:
     """Data Configuration"""
     # Logging
-    enable_logging: bool = os.getenv('DATA_ENABLE_LOGGING', 'True').lower() == 'true'
-    log_directory: str = os.getenv('DATA_LOG_DIRECTORY', 'data/logs')
-    export_directory: str = os.getenv('DATA_EXPORT_DIRECTORY', 'data/exports')
+    enable_logging: bool = _env_bool('DATA_ENABLE_LOGGING', True)
+    log_directory: str = _env('DATA_LOG_DIRECTORY', 'data/logs')
+    export_directory: str = _env('DATA_EXPORT_DIRECTORY', 'data/exports')
     
     # Retention
-    max_history_points: int = int(os.getenv('DATA_MAX_HISTORY', '10000'))
-    export_formats: List[str] = os.getenv('DATA_EXPORT_FORMATS', 'csv,json,kml').split(',')
+    max_history_points: int = _env('DATA_MAX_HISTORY', 10000, int)
+    export_formats: Tuple[str, ...] = field(default_factory=lambda: _EXPORT_FORMATS)
     
     # Performance
-    cache_enabled: bool = os.getenv('DATA_CACHE_ENABLED', 'True').lower() == 'true'
-    cache_ttl: int = int(os.getenv('DATA_CACHE_TTL', '300'))  # seconds
+    cache_enabled: bool = _env_bool('DATA_CACHE_ENABLED', True)
+    cache_ttl: int = _env('DATA_CACHE_TTL', 300, int)  # seconds
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SatelliteConfig:
     """Satellite Systems Configuration"""
-    systems: Dict[str, Dict] = None
+    # Default systems, shared read-only by every instance. Use systems_dict() for
+    # a plain, JSON-serializable copy that can be modified.
+    _DEFAULT: ClassVar[Mapping[str, Mapping]] = MappingProxyType({
+        'GPS': MappingProxyType({
+            'enabled': True,
+            'color': '#00ff88',
+            'priority': 1,
+            'description': 'Global Positioning System (USA)'
+        }),
+        'GLONASS': MappingProxyType({
+            'enabled': True,
+            'color': '#ff4444',
+            'priority': 2,
+            'description': 'Global Navigation Satellite System (Russia)'
+        }),
+        'Galileo': MappingProxyType({
+            'enabled': True,
+            'color': '#4488ff',
+            'priority': 3,
+            'description': 'European Global Navigation Satellite System'
+        }),
+        'BeiDou': MappingProxyType({
+            'enabled': True,
+            'color': '#ffaa00',
+            'priority': 4,
+            'description': 'BeiDou Navigation Satellite System (China)'
+        }),
+        'QZSS': MappingProxyType({
+            'enabled': False,
+            'color': '#aa00ff',
+            'priority': 5,
+            'description': 'Quasi-Zenith Satellite System (Japan)'
+        }),
+        'SBAS': MappingProxyType({
+            'enabled': False,
+            'color': '#ff00aa',
+            'priority': 6,
+            'description': 'Satellite-Based Augmentation Systems'
+        })
+    })
+
+    systems: Mapping[str, Mapping] = None
     
     def __post_init__(self):
         if self.systems is None:
-            self.systems = {
-                'GPS': {
-                    'enabled': True,
-                    'color': '#00ff88',
-                    'priority': 1,
-                    'description': 'Global Positioning System (USA)'
-                },
-                'GLONASS': {
-                    'enabled': True,
-                    'color': '#ff4444',
-                    'priority': 2,
-                    'description': 'Global Navigation Satellite System (Russia)'
-                },
-                'Galileo': {
-                    'enabled': True,
-                    'color': '#4488ff',
-                    'priority': 3,
-                    'description': 'European Global Navigation Satellite System'
-                },
-                'BeiDou': {
-                    'enabled': True,
-                    'color': '#ffaa00',
-                    'priority': 4,
-                    'description': 'BeiDou Navigation Satellite System (China)'
-                },
-                'QZSS': {
-                    'enabled': False,
-                    'color': '#aa00ff',
-                    'priority': 5,
-                    'description': 'Quasi-Zenith Satellite System (Japan)'
-                },
-                'SBAS': {
-                    'enabled': False,
-                    'color': '#ff00aa',
-                    'priority': 6,
-                    'description': 'Satellite-Based Augmentation Systems'
-                }
-            }
+            # Frozen dataclass: bypass __setattr__ to fill in the default
+            object.__setattr__(self, 'systems', self._DEFAULT)
+
+    def systems_dict(self):
+        """Return systems as plain nested dicts, e.g. for json.dumps()/jsonify()"""
+        return {name: dict(system) for name, system in self.systems.items()}
 
 # Create configuration instances
 gnss_config = GNSSConfig()
@@ -139,39 +236,81 @@ logging_config = LoggingConfig()
 data_config = DataConfig()
 satellite_config = SatelliteConfig()
 
-# Base directory
-BASE_DIR = Path(__file__).resolve().parent.parent
+# Flattened hot-path settings so per-packet and per-request code can read
+# plain globals instead of chained attribute lookups on the config instances
+GNSS_PORT = gnss_config.port
+GNSS_BAUDRATE = gnss_config.baudrate
+GNSS_TIMEOUT = gnss_config.timeout
+GNSS_PROTOCOL = gnss_config.protocol
+GNSS_ENABLE_RTCM = gnss_config.enable_rtcm
+GNSS_ENABLE_NMEA = gnss_config.enable_nmea
+GNSS_UBX_RATE = gnss_config.ubx_rate
+GNSS_NAV_RATE = gnss_config.nav_rate
+WEB_DEBUG = web_config.debug
+WEB_CORS_ORIGINS = web_config.cors_origins
+
+# Base directory; set APP_BASE_DIR (e.g. in container images) to skip
+# resolving the path on the filesystem at import
+_base_dir = _env('APP_BASE_DIR', None)
+BASE_DIR = Path(_base_dir) if _base_dir else Path(__file__).resolve().parent.parent
+del _base_dir
+
+class _LazyDirRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that creates its directory on first open"""
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+# Logging setup state; guards against handlers being installed twice when
+# setup_logging() is called again (reloaders, multiple workers per process)
+_logging_lock = threading.Lock()
+_logging_done = False
+_log_formatter = None
 
 # Logging setup function
 def setup_logging():
-    """Configure logging based on settings"""
+    """Configure logging based on settings (idempotent)"""
+    global _logging_done, _log_formatter
     logger = logging.getLogger()
-    logger.setLevel(getattr(logging, logging_config.level))
-    
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_formatter = logging.Formatter(
-        logging_config.format,
-        datefmt=logging_config.date_format
-    )
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler
-    if logging_config.file_enabled:
-        os.makedirs(os.path.dirname(logging_config.file_path), exist_ok=True)
-        file_handler = logging.handlers.RotatingFileHandler(
-            logging_config.file_path,
-            maxBytes=logging_config.max_file_size,
-            backupCount=logging_config.backup_count
-        )
-        file_formatter = logging.Formatter(
-            logging_config.format,
-            datefmt=logging_config.date_format
-        )
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
-    
+    if _logging_done:
+        return logger
+
+    with _logging_lock:
+        if _logging_done:
+            return logger
+
+        logger.setLevel(logging_config.level_int)
+        # Drop handlers installed elsewhere, closing them to release files
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+
+        # One formatter shared by all handlers
+        if _log_formatter is None:
+            _log_formatter = logging.Formatter(
+                logging_config.format,
+                datefmt=logging_config.date_format
+            )
+
+        # Console handler
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(_log_formatter)
+        logger.addHandler(console_handler)
+
+        # File handler
+        if logging_config.file_enabled:
+            file_handler = _LazyDirRotatingFileHandler(
+                logging_config.file_path,
+                maxBytes=logging_config.max_file_size,
+                backupCount=logging_config.backup_count,
+                delay=True
+            )
+            file_handler.setFormatter(_log_formatter)
+            logger.addHandler(file_handler)
+
+        _logging_done = True
+
     return logger
 
 # Export configuration
@@ -183,6 +322,15 @@ __all__ = [
     'data_config',
     'satellite_config',
     'BASE_DIR',
-    'setup_logging'
+    'setup_logging',
+    'GNSS_PORT',
+    'GNSS_BAUDRATE',
+    'GNSS_TIMEOUT',
+    'GNSS_PROTOCOL',
+    'GNSS_ENABLE_RTCM',
+    'GNSS_ENABLE_NMEA',
+    'GNSS_UBX_RATE',
+    'GNSS_NAV_RATE',
+    'WEB_DEBUG',
+    'WEB_CORS_ORIGINS'
 ]
-
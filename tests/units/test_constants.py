@@ -0,0 +1,99 @@
+"""
+Tests for application constants
+"""
+
+import json
+
+import pytest
+
+from config.constants import (
+    API_RESPONSE,
+    API_RESPONSE_ERROR_BYTES,
+    API_RESPONSE_SUCCESS_BYTES,
+    COLORS,
+    COLORS_MAP,
+    ERROR_CODES,
+    NMEA_SENTENCES,
+    STATUS_MESSAGES,
+    ErrorCode,
+    Palette,
+    _hex_to_rgb,
+    fix_quality_name,
+    signal_quality_name,
+    ubx_class_name,
+)
+
+
+def test_error_code_str_is_message():
+    assert str(ErrorCode.GNSS001) == 'GNSS receiver not connected'
+    assert f'{ErrorCode.GNSS001}' == 'GNSS receiver not connected'
+    assert str(Exception(ErrorCode.GNSS001)) == 'GNSS receiver not connected'
+
+
+def test_api_response_templates_are_read_only():
+    with pytest.raises(TypeError):
+        API_RESPONSE['success']['code'] = 500
+    with pytest.raises(TypeError):
+        API_RESPONSE['new'] = {}
+
+
+def test_api_response_templates_serialize_via_copy():
+    payload = {**API_RESPONSE['success'], 'data': [1]}
+    assert json.loads(json.dumps(payload)) == {'status': 'success', 'code': 200, 'data': [1]}
+    assert json.loads(json.dumps(dict(API_RESPONSE['error']))) == {'status': 'error', 'code': 400}
+    assert json.loads(API_RESPONSE_SUCCESS_BYTES) == API_RESPONSE['success']
+    assert json.loads(API_RESPONSE_ERROR_BYTES) == API_RESPONSE['error']
+
+
+def test_lookup_tables_serialize_via_dict():
+    for table in (ERROR_CODES, STATUS_MESSAGES, NMEA_SENTENCES):
+        assert json.loads(json.dumps(dict(table))) == dict(table)
+
+
+def test_fix_quality_name_bounds():
+    assert fix_quality_name(4) == 'RTK Fixed'
+    assert fix_quality_name(8) == 'Simulation'
+    assert fix_quality_name(9) is None
+    assert fix_quality_name(-1) is None
+
+
+def test_signal_quality_name_bounds():
+    assert signal_quality_name(0) == 'No Signal'
+    assert signal_quality_name(7) is None
+    assert signal_quality_name(-1) is None
+
+
+def test_ubx_class_name():
+    assert ubx_class_name(0x01) == 'NAV'
+    assert ubx_class_name(0x28) == 'HNR'
+    assert ubx_class_name(0x03) is None
+    assert ubx_class_name(0x29) is None
+    assert ubx_class_name(-1) is None
+
+
+def test_hex_to_rgb():
+    assert _hex_to_rgb('#0066cc') == (0, 102, 204)
+    assert _hex_to_rgb('#f8f9fa') == (248, 249, 250)
+
+
+def test_palette_hex_and_rgb():
+    assert isinstance(COLORS, Palette)
+    assert COLORS.primary == '#0066cc'
+    assert COLORS.primary_rgb == (0, 102, 204)
+    for name in COLORS_MAP:
+        assert getattr(COLORS, name + '_rgb') == _hex_to_rgb(getattr(COLORS, name))
+
+
+def test_colors_map_matches_previous_colors_dict():
+    assert dict(COLORS_MAP) == {
+        'primary': '#0066cc',
+        'secondary': '#00cc66',
+        'accent': '#ff9900',
+        'danger': '#ff4444',
+        'warning': '#ffaa00',
+        'info': '#00aaff',
+        'success': '#00cc88',
+        'dark': '#1a1a2e',
+        'light': '#f8f9fa'
+    }
+    assert COLORS_MAP['primary'] == COLORS.primary
@@ -0,0 +1,201 @@
+"""
+Tests for configuration settings
+"""
+
+import importlib
+import json
+import logging
+from pathlib import Path
+from dataclasses import asdict
+
+import pytest
+
+import config.settings as settings
+from config.settings import LoggingConfig, MapConfig, SatelliteConfig, satellite_config
+
+
+def test_satellite_config_default_is_shared():
+    assert SatelliteConfig().systems is satellite_config.systems
+
+
+def test_satellite_config_defaults_are_read_only():
+    with pytest.raises(TypeError):
+        SatelliteConfig().systems['GPS']['enabled'] = False
+    with pytest.raises(TypeError):
+        SatelliteConfig().systems['NEW'] = {}
+    assert satellite_config.systems['GPS']['enabled'] is True
+
+
+def test_satellite_config_systems_dict_is_json_serializable():
+    data = satellite_config.systems_dict()
+    assert json.loads(json.dumps(data)) == data
+    data['GPS']['enabled'] = False
+    assert satellite_config.systems['GPS']['enabled'] is True
+
+
+def test_satellite_config_class_default_is_read_only():
+    with pytest.raises(TypeError):
+        SatelliteConfig._DEFAULT['GPS'] = {}
+    with pytest.raises(TypeError):
+        SatelliteConfig._DEFAULT['GPS']['priority'] = 9
+
+
+def test_flat_config_exports():
+    flat = [name for name in settings.__all__ if name.startswith(('GNSS_', 'WEB_'))]
+    assert flat == [
+        'GNSS_PORT', 'GNSS_BAUDRATE', 'GNSS_TIMEOUT', 'GNSS_PROTOCOL',
+        'GNSS_ENABLE_RTCM', 'GNSS_ENABLE_NMEA', 'GNSS_UBX_RATE', 'GNSS_NAV_RATE',
+        'WEB_DEBUG', 'WEB_CORS_ORIGINS',
+    ]
+    for name in settings.__all__:
+        assert hasattr(settings, name)
+    assert settings.GNSS_BAUDRATE == settings.gnss_config.baudrate
+    assert settings.WEB_DEBUG == settings.web_config.debug
+
+
+def test_secret_key_not_exported():
+    assert not any('SECRET' in name for name in settings.__all__)
+    assert not hasattr(settings, 'WEB_SECRET_KEY')
+
+
+def test_tile_url_matches_str_format():
+    config = MapConfig(tile_provider='https://{s}.tile.example.org/{z}/{x}/{y}.png')
+    assert config.tile_url('a', 3, 4, 5) == 'https://a.tile.example.org/3/4/5.png'
+
+
+def test_default_map_config_tile_urls():
+    config = settings.map_config
+    assert config.tile_url('a', 1, 2, 3) == config.tile_provider.format(s='a', z=1, x=2, y=3)
+    assert config.satellite_tile_url('a', 1, 2, 3) == config.satellite_url.format(z=1, x=2, y=3)
+
+
+def test_satellite_tile_url_keeps_placeholder_order():
+    config = MapConfig(satellite_url='https://imagery.example.org/tile/{z}/{y}/{x}')
+    assert config.satellite_tile_url('a', 3, 4, 5) == 'https://imagery.example.org/tile/3/5/4'
+
+
+def test_tile_url_single_placeholder():
+    config = MapConfig(tile_provider='https://example.org/level-{z}.png')
+    assert config.tile_url('a', 7, 0, 0) == 'https://example.org/level-7.png'
+
+
+def test_tile_url_escapes_percent():
+    config = MapConfig(tile_provider='https://example.org/my%20tiles/{z}/{x}/{y}.png')
+    assert config.tile_url('a', 1, 2, 3) == 'https://example.org/my%20tiles/1/2/3.png'
+
+
+def test_map_config_asdict_has_no_compiled_templates():
+    assert not any(key.startswith('_') for key in asdict(MapConfig()))
+
+
+def test_level_int_resolves_known_level():
+    assert LoggingConfig(level='DEBUG').level_int == logging.DEBUG
+
+
+def test_level_int_warns_on_unknown_level(caplog):
+    with caplog.at_level(logging.WARNING, logger='config.settings'):
+        config = LoggingConfig(level='DEBG')
+    assert config.level_int == logging.INFO
+    assert "Unknown log level 'DEBG'" in caplog.text
+
+
+def test_csv_single_and_multiple_values():
+    assert settings._csv('*') == ('*',)
+    assert settings._csv('csv,json') == ('csv', 'json')
+
+
+@pytest.fixture
+def env_cache(monkeypatch):
+    """Give _env() an empty cache so tests do not leak into module state"""
+    cache = {}
+    monkeypatch.setattr(settings, '_ENV_CACHE', cache)
+    return cache
+
+
+def test_env_casts_values(monkeypatch, env_cache):
+    monkeypatch.setenv('TEST_ENV_INT', '115200')
+    monkeypatch.setenv('TEST_ENV_FLOAT', '0.5')
+    monkeypatch.setenv('TEST_ENV_STR', 'UBX')
+    assert settings._env('TEST_ENV_INT', 9600, int) == 115200
+    assert settings._env('TEST_ENV_FLOAT', 1.0, float) == 0.5
+    assert settings._env('TEST_ENV_STR', 'NMEA') == 'UBX'
+
+
+def test_env_bool(monkeypatch, env_cache):
+    monkeypatch.setenv('TEST_ENV_TRUE', 'True')
+    monkeypatch.setenv('TEST_ENV_FALSE', 'false')
+    monkeypatch.setenv('TEST_ENV_OTHER', 'yes')
+    assert settings._env_bool('TEST_ENV_TRUE', False) is True
+    assert settings._env_bool('TEST_ENV_FALSE', True) is False
+    assert settings._env_bool('TEST_ENV_OTHER', True) is False
+    assert settings._env_bool('TEST_ENV_UNSET', True) is True
+
+
+def test_env_caches_missing_value_as_default(monkeypatch, env_cache):
+    monkeypatch.delenv('TEST_ENV_LATE', raising=False)
+    assert settings._env('TEST_ENV_LATE', 5, int) == 5
+    assert env_cache['TEST_ENV_LATE'] == 5
+    monkeypatch.setenv('TEST_ENV_LATE', '7')
+    assert settings._env('TEST_ENV_LATE', 5, int) == 5
+
+
+def test_env_csv(monkeypatch, env_cache):
+    monkeypatch.setenv('TEST_ENV_CSV_VALUES', 'http://a,http://b')
+    assert settings._env_csv('TEST_ENV_CSV_VALUES', ()) == ('http://a', 'http://b')
+    default = ('*',)
+    assert settings._env_csv('TEST_ENV_CSV_UNSET', default) is default
+
+
+@pytest.fixture
+def fresh_logging(monkeypatch, tmp_path):
+    """Run setup_logging() against an empty root logger and a temp log file"""
+    root = logging.getLogger()
+    monkeypatch.setattr(root, 'handlers', [])
+    monkeypatch.setattr(settings, '_logging_done', False)
+    log_path = tmp_path / 'logs' / 'gnss_viewer.log'
+    monkeypatch.setattr(settings, 'logging_config',
+                        LoggingConfig(file_enabled=True, file_path=str(log_path)))
+    yield log_path
+    for handler in root.handlers:
+        handler.close()
+
+
+def test_setup_logging_is_idempotent(fresh_logging):
+    logger = settings.setup_logging()
+    assert len(logger.handlers) == 2
+    settings.setup_logging()
+    assert len(logger.handlers) == 2
+
+
+def test_setup_logging_closes_replaced_handlers(fresh_logging, monkeypatch):
+    logger = settings.setup_logging()
+    logger.warning('opens the log file')
+    old_handlers = list(logger.handlers)
+    assert old_handlers[1].stream is not None
+    monkeypatch.setattr(settings, '_logging_done', False)
+    settings.setup_logging()
+    assert len(logger.handlers) == 2
+    assert old_handlers[1].stream is None
+
+
+def test_log_directory_created_on_first_record(fresh_logging):
+    logger = settings.setup_logging()
+    assert not fresh_logging.parent.exists()
+    logger.warning('first record')
+    assert fresh_logging.exists()
+
+
+
+def test_base_dir_defaults_to_repo_root():
+    assert settings.BASE_DIR == Path(settings.__file__).resolve().parent.parent
+
+
+def test_app_base_dir_overrides_base_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv('APP_BASE_DIR', str(tmp_path))
+    try:
+        importlib.reload(settings)
+        assert settings.BASE_DIR == tmp_path
+        assert not hasattr(settings, '_base_dir')
+    finally:
+        monkeypatch.delenv('APP_BASE_DIR')
+        importlib.reload(settings)